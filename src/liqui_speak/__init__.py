@@ -1,14 +1,61 @@
 """Liqui-Speak: Automated audio transcription with LFM2.5-Audio model."""
 
-from importlib.metadata import version
+import importlib
+from typing import TYPE_CHECKING, Any
 
-__version__ = version("liqui-speak")
 __author__ = "Abhishek Bhakat"
 __description__ = "One-command setup for real-time audio transcription"
 
-from liqui_speak.core.config import get_config
-from liqui_speak.core.transcription import transcribe_audio
+if TYPE_CHECKING:
+    __version__: str
 
-transcribe = transcribe_audio
+    from liqui_speak.core.config import get_config
+    from liqui_speak.core.transcription import (
+        transcribe_audio,
+        transcribe_audio_async,
+        transcribe_batch,
+        transcribe_iter,
+    )
 
-__all__ = ["transcribe_audio", "transcribe", "get_config"]
+    transcribe = transcribe_audio
+
+# Public names resolved on first access, so importing the package (e.g. for
+# the CLI's --version) does not pull in the transcription stack
+_LAZY_ATTRS: dict[str, tuple[str, str]] = {
+    "transcribe_audio": ("liqui_speak.core.transcription", "transcribe_audio"),
+    "transcribe_audio_async": ("liqui_speak.core.transcription", "transcribe_audio_async"),
+    "transcribe_batch": ("liqui_speak.core.transcription", "transcribe_batch"),
+    "transcribe_iter": ("liqui_speak.core.transcription", "transcribe_iter"),
+    "transcribe": ("liqui_speak.core.transcription", "transcribe_audio"),
+    "get_config": ("liqui_speak.core.config", "get_config"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public API members lazily (PEP 562)."""
+    if name == "__version__":
+        # Reading package metadata costs more than the rest of the import
+        from importlib.metadata import version
+
+        value = version("liqui-speak")
+        globals()[name] = value
+        return value
+
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+__all__ = [
+    "transcribe_audio",
+    "transcribe_audio_async",
+    "transcribe_batch",
+    "transcribe_iter",
+    "transcribe",
+    "get_config",
+]
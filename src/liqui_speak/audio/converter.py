@@ -1,5 +1,7 @@
-"""Fast audio format converter using PyDub for M4A/AAC support."""
+"""Fast audio format converter using FFmpeg, with PyDub as a fallback."""
 
+import shutil
+import subprocess
 import tempfile
 from pathlib import Path
 
@@ -10,7 +12,9 @@ def convert_audio_for_transcription(input_file: str, output_format: str = "wav")
     """
     Convert audio file to format supported by the transcription tool.
 
-    Uses PyDub for fast in-memory conversion without external ffmpeg calls.
+    Spawns ffmpeg directly when it is on PATH so decoding, downmixing and
+    resampling happen in C without materializing samples in Python. Falls
+    back to PyDub when ffmpeg cannot be located.
 
     Args:
         input_file: Path to input audio file (M4A, AAC, etc.)
@@ -20,9 +24,71 @@ def convert_audio_for_transcription(input_file: str, output_format: str = "wav")
         Path to converted audio file (temporary file)
 
     Raises:
-        ImportError: If PyDub is not installed
+        ImportError: If neither ffmpeg nor PyDub is available
         ValueError: If conversion fails
     """
+    input_path = Path(input_file)
+
+    temp_file = tempfile.NamedTemporaryFile(
+        suffix=f".{output_format}",
+        delete=False,
+        prefix="liqui_speak_"
+    )
+    temp_file.close()
+
+    try:
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg:
+            _convert_with_ffmpeg(ffmpeg, input_path, temp_file.name, output_format)
+        else:
+            _convert_with_pydub(input_path, temp_file.name, output_format)
+        return temp_file.name
+
+    except Exception as e:
+        Path(temp_file.name).unlink(missing_ok=True)
+        if isinstance(e, ImportError):
+            raise
+        raise ValueError(f"Audio conversion failed: {e}") from e
+
+
+def _ffmpeg_args(ffmpeg: str, input_path: Path) -> list[str]:
+    """Build the common ffmpeg decode/downmix/resample arguments."""
+    sample_rate = int(get_config()["sample_rate"])
+    return [
+        ffmpeg,
+        "-nostdin",
+        "-loglevel", "error",
+        "-y",
+        "-i", str(input_path),
+        "-ac", "1",
+        "-ar", str(sample_rate),
+    ]
+
+
+def _run_ffmpeg(cmd: list[str]) -> bytes:
+    """Run ffmpeg and return its stdout, raising with stderr on failure."""
+    result = subprocess.run(cmd, capture_output=True, check=False)
+    if result.returncode != 0:
+        stderr = result.stderr.decode("utf-8", errors="replace").strip()
+        raise RuntimeError(stderr or f"ffmpeg exited with code {result.returncode}")
+    return result.stdout
+
+
+def _convert_with_ffmpeg(
+    ffmpeg: str, input_path: Path, output_path: str, output_format: str
+) -> None:
+    """Convert audio by spawning ffmpeg once with the exact output spec."""
+    cmd = _ffmpeg_args(ffmpeg, input_path) + ["-f", output_format]
+    if output_format == "wav":
+        cmd += ["-acodec", "pcm_s16le"]
+    cmd.append(output_path)
+    _run_ffmpeg(cmd)
+
+
+def _convert_with_pydub(
+    input_path: Path, output_path: str, output_format: str
+) -> None:
+    """Convert audio using PyDub when ffmpeg is not on PATH."""
     try:
         from pydub import AudioSegment
     except ImportError:
@@ -31,29 +97,11 @@ def convert_audio_for_transcription(input_file: str, output_format: str = "wav")
             "Install with: pip install pydub"
         ) from None
 
-    input_path = Path(input_file)
+    sample_rate = int(get_config()["sample_rate"])
 
-    try:
+    audio = AudioSegment.from_file(str(input_path))
+    audio = audio.set_channels(1)
+    audio = audio.set_frame_rate(sample_rate)
 
-        audio = AudioSegment.from_file(str(input_path))
-
-
-        audio = audio.set_channels(1)
-        audio = audio.set_frame_rate(int(get_config()["sample_rate"]))
-
-
-        temp_file = tempfile.NamedTemporaryFile(
-            suffix=f".{output_format}",
-            delete=False,
-            prefix="liqui_speak_"
-        )
-        temp_file.close()
-
-
-        audio.export(temp_file.name, format=output_format,
-                    codec="pcm_s16le" if output_format == "wav" else None)
-
-        return temp_file.name
-
-    except Exception as e:
-        raise ValueError(f"Audio conversion failed: {e}") from e
+    audio.export(output_path, format=output_format,
+                codec="pcm_s16le" if output_format == "wav" else None)
@@ -1,15 +1,127 @@
 """Audio format detection and validation."""
 
+import functools
+import os
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 
-SUPPORTED_FORMATS: set[str] = {
+SUPPORTED_FORMATS: frozenset[str] = frozenset({
     '.wav', '.mp3', '.m4a', '.aac', '.flac', '.ogg', '.wma'
-}
+})
 
 
-CONVERSION_REQUIRED_FORMATS: set[str] = {
+CONVERSION_REQUIRED_FORMATS: frozenset[str] = frozenset({
     '.mp3', '.m4a', '.aac', '.flac', '.ogg', '.wma'
-}
+})
+
+
+# Bytes read from the start of a file for content sniffing
+_HEADER_SIZE = 4096
+
+_MIME_TO_FORMAT: Mapping[str, str] = MappingProxyType({
+    'audio/wav': 'wav',
+    'audio/wave': 'wav',
+    'audio/x-wav': 'wav',
+    'audio/vnd.wave': 'wav',
+    'audio/mpeg': 'mp3',
+    'audio/mp3': 'mp3',
+    'audio/mp4': 'm4a',
+    'audio/m4a': 'm4a',
+    'audio/x-m4a': 'm4a',
+    'audio/aac': 'aac',
+    'audio/x-aac': 'aac',
+    'audio/flac': 'flac',
+    'audio/x-flac': 'flac',
+    'audio/ogg': 'ogg',
+    'application/ogg': 'ogg',
+    'audio/x-ms-wma': 'wma',
+    'video/x-ms-asf': 'wma',
+    'video/x-ms-wmv': 'wma',
+})
+
+# Format names (as returned by detect_audio_format) that can be transcribed
+_SUPPORTED_FORMAT_NAMES: frozenset[str] = frozenset(
+    ext.lstrip('.') for ext in SUPPORTED_FORMATS
+)
+
+_UNSUPPORTED_EXTENSIONS: frozenset[str] = frozenset({'.m4p', '.m3u', '.m3u8'})
+
+# ASF header object GUID used by WMA files
+_ASF_GUID = bytes.fromhex('3026b2758e66cf11a6d900aa0062ce6c')
+
+
+def detect_audio_format(file_path: str) -> str | None:
+    """
+    Detect an audio file's format from its content.
+
+    Only the first few KiB of the file are read and matched in pure Python.
+
+    Args:
+        file_path: Path to the audio file
+
+    Returns:
+        Format name such as 'wav' or 'm4a', or None if not recognised
+    """
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+
+    return _detect_format(file_path, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=512)
+def _detect_format(file_path: str, mtime_ns: int, size: int) -> str | None:
+    """
+    Detect the audio format of a file from its header.
+
+    Keyed on modification time and size so a rewritten file is re-detected.
+    """
+    if size == 0:
+        return None
+
+    try:
+        with open(file_path, 'rb') as f:
+            header = f.read(_HEADER_SIZE)
+    except OSError:
+        return None
+
+    audio_format = _sniff_audio(header)
+    if audio_format is not None:
+        return audio_format
+
+    # Only needed for headers the built-in sniffer does not recognise
+    import puremagic
+
+    try:
+        mime = puremagic.from_string(header, mime=True)
+    except puremagic.PureError:
+        return None
+
+    return _MIME_TO_FORMAT.get(mime)
+
+
+def _sniff_audio(header: bytes) -> str | None:
+    """Identify common audio containers from their magic bytes."""
+    if header[:4] == b'RIFF' and header[8:12] == b'WAVE':
+        return 'wav'
+    if header[:4] == b'fLaC':
+        return 'flac'
+    if header[:4] == b'OggS':
+        return 'ogg'
+    if header[:3] == b'ID3':
+        return 'mp3'
+    if header[4:8] == b'ftyp':
+        return 'm4p' if header[8:12] == b'M4P ' else 'm4a'
+    if header[:4] == b'FORM' and header[8:12] in (b'AIFF', b'AIFC'):
+        return 'aiff'
+    if header[:16] == _ASF_GUID:
+        return 'wma'
+    if len(header) >= 2 and header[0] == 0xFF and header[1] & 0xE0 == 0xE0:
+        # MPEG frame sync; layer bits of 00 mean an ADTS AAC stream
+        return 'aac' if header[1] & 0x06 == 0 else 'mp3'
+    return None
 
 
 def is_format_supported(file_path: str) -> bool:
@@ -22,8 +134,14 @@ def is_format_supported(file_path: str) -> bool:
     Returns:
         True if format is supported, False otherwise
     """
-    path = Path(file_path)
-    return path.suffix.lower() in SUPPORTED_FORMATS
+    suffix = Path(file_path).suffix.lower()
+    if suffix in SUPPORTED_FORMATS:
+        return True
+    if suffix in _UNSUPPORTED_EXTENSIONS:
+        return False
+
+    # Only sniff content for unknown or missing extensions
+    return detect_audio_format(file_path) in _SUPPORTED_FORMAT_NAMES
 
 
 def needs_conversion(file_path: str) -> bool:
@@ -2,12 +2,25 @@
 
 import argparse
 import sys
-from importlib.metadata import version
 
-from liqui_speak.cli.commands import handle_config, handle_transcribe
 from liqui_speak.core.config import setup_logging
 
 
+class _VersionAction(argparse.Action):
+    """Print the version, reading package metadata only when asked for it."""
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS,
+                 help="show program's version number and exit"):
+        super().__init__(option_strings=option_strings, dest=dest, default=default,
+                         nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        from liqui_speak import __version__
+
+        print(f"{parser.prog} {__version__}")
+        parser.exit()
+
+
 def main():
     """Main CLI entry point."""
 
@@ -27,8 +40,7 @@ Examples:
 
     parser.add_argument(
         "--version",
-        action="version",
-        version=f"%(prog)s {version('liqui-speak')}"
+        action=_VersionAction
     )
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
@@ -54,6 +66,13 @@ Examples:
         default="F16",
         help="Model quantization level: F16 (default, best quality), Q8_0 (smaller), Q4_0 (smallest)"
     )
+    config_parser.add_argument(
+        "--download-workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Model files to download in parallel (default: $HF_PARALLEL_DOWNLOADING_WORKERS or 8)"
+    )
 
 
     transcribe_parser = subparsers.add_parser(
@@ -89,8 +108,10 @@ Examples:
 
     try:
         if args.command == "config":
+            from liqui_speak.cli.commands import handle_config
             return handle_config(args)
         elif args.command == "transcribe":
+            from liqui_speak.cli.commands import handle_transcribe
             return handle_transcribe(args)
         else:
             parser.print_help()
@@ -3,16 +3,15 @@
 import logging
 from pathlib import Path
 
-from liqui_speak.core.transcription import transcribe_audio
-from liqui_speak.setup.manager import SetupManager
-
 
 def handle_config(args) -> int:
     """Handle config command."""
+    from liqui_speak.setup.manager import SetupManager
+
     logger = logging.getLogger("liqui_speak")
     logger.info("Starting Liqui-Speak configuration...")
 
-    setup_manager = SetupManager()
+    setup_manager = SetupManager(download_workers=args.download_workers)
 
     if args.force:
         logger.info("Force mode enabled - reinstalling everything")
@@ -34,6 +33,8 @@ def handle_config(args) -> int:
 
 def handle_transcribe(args) -> int:
     """Handle transcribe command."""
+    from liqui_speak.core.transcription import transcribe_audio
+
     logger = logging.getLogger("liqui_speak")
 
 
@@ -1,15 +1,24 @@
 """Configuration management for Liqui-Speak."""
 
+import functools
 import json
 import logging
 import os
+from collections.abc import Callable, Mapping
 from pathlib import Path
+from types import MappingProxyType
 
 # Available quantization levels
 QUANT_LEVELS = ["F16", "Q8_0", "Q4_0"]
 DEFAULT_QUANT = "F16"
 
 CONFIG_FILE = "config.json"
+MANIFEST_FILE = ".manifest.json"
+
+SETUP_DIR = Path.home() / ".liqui_speak"
+MODELS_DIR = SETUP_DIR / "models"
+
+ENV_PREFIX = "LIQUI_SPEAK_"
 
 def get_model_files(quant: str = DEFAULT_QUANT) -> dict[str, str]:
     """Get model filenames for the specified quantization level."""
@@ -39,7 +48,12 @@ def setup_logging() -> logging.Logger:
 
 def get_config_file_path() -> Path:
     """Get path to config.json file."""
-    return Path.home() / ".liqui_speak" / CONFIG_FILE
+    return SETUP_DIR / CONFIG_FILE
+
+
+def get_manifest_path() -> Path:
+    """Get path to the verified model file manifest."""
+    return SETUP_DIR / MANIFEST_FILE
 
 
 def load_user_config() -> dict:
@@ -60,31 +74,61 @@ def save_user_config(config: dict) -> None:
     config_path.parent.mkdir(parents=True, exist_ok=True)
     with open(config_path, "w") as f:
         json.dump(config, f, indent=2)
+    _build_config.cache_clear()
+
 
+def _int_or_float(value: str) -> int | float:
+    """Parse an integer setting, accepting a float if that is what was given."""
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
 
-def get_config() -> dict[str, str | int | float]:
+
+# Parsers for numeric settings overridable through LIQUI_SPEAK_* variables
+_COERCERS: dict[str, Callable[[str], str | int | float]] = {
+    "sample_rate": _int_or_float,
+    "channels": _int_or_float,
+    "transcription_timeout": _int_or_float,
+    "chunk_duration": float,
+    "overlap": float,
+}
+
+
+def get_config() -> Mapping[str, str | int | float]:
     """
     Get configuration for transcription.
 
+    The result is built once and reused until a LIQUI_SPEAK_* environment
+    variable or the saved user config changes.
+
     Returns:
-        Configuration dictionary with model paths and settings
+        Read-only configuration mapping with model paths and settings
     """
-    setup_dir = Path.home() / ".liqui_speak"
-    models_dir = setup_dir / "models"
-    
+    env_overrides = tuple(sorted(
+        (key, value) for key, value in os.environ.items() if key.startswith(ENV_PREFIX)
+    ))
+    return _build_config(env_overrides)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_config(
+    env_overrides: tuple[tuple[str, str], ...]
+) -> Mapping[str, str | int | float]:
+    """Build the configuration mapping for a snapshot of environment overrides."""
     # Load user config to get quantization level
     user_config = load_user_config()
     quant = user_config.get("quant", DEFAULT_QUANT)
     model_files = get_model_files(quant)
 
-    config = {
-        "model_dir": str(models_dir),
-        "model_path": str(models_dir / model_files["model"]),
-        "mmproj_path": str(models_dir / model_files["mmproj"]),
-        "vocoder_path": str(models_dir / model_files["vocoder"]),
-        "tokenizer_path": str(models_dir / model_files["tokenizer"]),
-        "binary_path": str(models_dir / "runners"),
-        "sample_rate": 48000,
+    config: dict[str, str | int | float] = {
+        "model_dir": str(MODELS_DIR),
+        "model_path": str(MODELS_DIR / model_files["model"]),
+        "mmproj_path": str(MODELS_DIR / model_files["mmproj"]),
+        "vocoder_path": str(MODELS_DIR / model_files["vocoder"]),
+        "tokenizer_path": str(MODELS_DIR / model_files["tokenizer"]),
+        "binary_path": str(MODELS_DIR / "runners"),
+        "sample_rate": 16000,
         "channels": 1,
         "chunk_duration": 2.0,
         "overlap": 0.5,
@@ -92,21 +136,12 @@ def get_config() -> dict[str, str | int | float]:
         "quant": quant,
     }
 
+    for env_key, value in env_overrides:
+        key = env_key[len(ENV_PREFIX):].lower()
+        if key in config:
+            config[key] = _COERCERS.get(key, str)(value)
 
-    for key in config:
-        env_key = f"LIQUI_SPEAK_{key.upper()}"
-        if env_key in os.environ:
-            if key in ["sample_rate", "channels", "transcription_timeout"]:
-                try:
-                    config[key] = int(os.environ[env_key])
-                except ValueError:
-                    config[key] = float(os.environ[env_key])
-            elif key in ["chunk_duration", "overlap"]:
-                config[key] = float(os.environ[env_key])
-            else:
-                config[key] = os.environ[env_key]
-
-    return config
+    return MappingProxyType(config)
 
 
 def is_configured() -> bool:
@@ -121,16 +156,29 @@ def is_configured() -> bool:
         config["tokenizer_path"],
     ]
 
-    for file_path in required_files:
-        if not Path(str(file_path)).exists():
-            return False
+    return all(os.path.exists(str(file_path)) for file_path in required_files)
 
-    return True
+
+def existing_files_in(directory: str | Path) -> frozenset[str]:
+    """
+    Get the names of all entries in a directory from a single scan.
+
+    Args:
+        directory: Directory to list
+
+    Returns:
+        Entry names, or an empty set if the directory does not exist
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries)
+    except (FileNotFoundError, NotADirectoryError):
+        return frozenset()
 
 
 def get_setup_dir() -> Path:
     """Get the setup directory path."""
-    return Path.home() / ".liqui_speak"
+    return SETUP_DIR
 
 
 def ensure_setup_dir() -> Path:
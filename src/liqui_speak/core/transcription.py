@@ -1,7 +1,14 @@
 """Audio transcription functionality for Liqui-Speak."""
 
+import functools
 import logging
+import os
+import queue
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import NamedTuple
 
 from liqui_speak.audio.converter import convert_audio_for_transcription
 from liqui_speak.audio.formats import needs_conversion
@@ -10,6 +17,25 @@ from liqui_speak.models.wrapper import LFM2AudioWrapper
 
 logger = logging.getLogger(__name__)
 
+# Number of converted files allowed to wait for the model in transcribe_iter
+_PIPELINE_DEPTH = 2
+
+# Runner processes transcribe_batch keeps alive at the same time
+_BATCH_CONCURRENCY = 2
+
+# Guards wrapper construction; each transcription runs its own subprocess, so
+# the shared wrapper itself is safe to use from several threads
+_model_lock = threading.Lock()
+
+
+class _Prepared(NamedTuple):
+    """Audio file ready to hand to the model."""
+
+    source: str
+    wav_file: str | None
+    is_temp: bool
+    error: Exception | None
+
 
 def transcribe_audio(
     audio_file_path: str,
@@ -25,35 +51,130 @@ def transcribe_audio(
     Returns:
         Transcribed text or None if failed
     """
-    audio_path = Path(audio_file_path)
+    wav_file, is_temp = _prepare_audio(audio_file_path, verbose)
+    if wav_file is None:
+        return None
 
-    if not audio_path.exists():
-        raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
+    try:
+        return _transcribe_wav_file(wav_file, verbose)
+    finally:
+        if is_temp:
+            _discard(wav_file)
 
 
-    if needs_conversion(audio_file_path):
-        if verbose:
-            print(f"🔄 Converting {audio_path.suffix} to WAV format...")
+def transcribe_iter(
+    audio_file_paths: Iterable[str],
+    verbose: bool = False
+) -> Iterator[tuple[str, str | None]]:
+    """
+    Transcribe audio files in order, converting the next ones ahead of time.
 
-        try:
+    A background thread runs format conversion while the model transcribes
+    the current file. The hand-off queue is bounded, so only a couple of
+    converted temporary files exist at any moment.
 
-            converted_file = convert_audio_for_transcription(audio_file_path, "wav")
+    Args:
+        audio_file_paths: Paths to audio files
+        verbose: Whether to show detailed progress
 
-            try:
-                return _transcribe_wav_file(converted_file, verbose)
-            finally:
+    Yields:
+        (audio_file_path, transcription) pairs; transcription is None if failed
+    """
+    ready: queue.Queue[_Prepared | None] = queue.Queue(maxsize=_PIPELINE_DEPTH)
+    cancelled = threading.Event()
 
+    def convert_ahead() -> None:
+        try:
+            for path in audio_file_paths:
+                if cancelled.is_set():
+                    break
                 try:
-                    Path(converted_file).unlink()
-                except OSError:
-                    pass
-        except Exception as e:
-            if verbose:
-                logger.error(f"❌ Audio conversion failed: {e}")
-            return None
-    else:
+                    wav_file, is_temp = _prepare_audio(path, verbose)
+                    ready.put(_Prepared(path, wav_file, is_temp, None))
+                except Exception as e:
+                    ready.put(_Prepared(path, None, False, e))
+        finally:
+            ready.put(None)
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="liqui_speak_convert") as executor:
+        producer = executor.submit(convert_ahead)
+        finished = False
+
+        try:
+            while (item := ready.get()) is not None:
+                try:
+                    if item.error is not None:
+                        raise item.error
+                    transcription = None
+                    if item.wav_file is not None:
+                        transcription = _transcribe_wav_file(item.wav_file, verbose)
+                    yield item.source, transcription
+                finally:
+                    if item.is_temp and item.wav_file is not None:
+                        _discard(item.wav_file)
+            finished = True
+        finally:
+            # Unblock the producer and clean up anything it converted ahead
+            cancelled.set()
+            while not finished:
+                item = ready.get()
+                if item is None:
+                    break
+                if item.is_temp and item.wav_file is not None:
+                    _discard(item.wav_file)
+
+        producer.result()
+
+
+async def transcribe_audio_async(
+    audio_file_path: str,
+    verbose: bool = False
+) -> str | None:
+    """
+    Transcribe an audio file without blocking the event loop.
+
+    Conversion and model inference run in a worker thread.
+
+    Args:
+        audio_file_path: Path to audio file
+        verbose: Whether to show detailed progress
+
+    Returns:
+        Transcribed text or None if failed
+    """
+    import asyncio
 
-        return _transcribe_wav_file(audio_file_path, verbose)
+    return await asyncio.to_thread(transcribe_audio, audio_file_path, verbose)
+
+
+async def transcribe_batch(
+    audio_file_paths: list[str],
+    verbose: bool = False,
+    max_concurrency: int = _BATCH_CONCURRENCY
+) -> list[str | None]:
+    """
+    Transcribe several audio files concurrently.
+
+    Every transcription loads the model in its own runner process, so only
+    a few run at once.
+
+    Args:
+        audio_file_paths: Paths to audio files
+        verbose: Whether to show detailed progress
+        max_concurrency: Maximum transcriptions running at the same time
+
+    Returns:
+        Transcriptions in the same order as the input paths
+    """
+    import asyncio
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded(path: str) -> str | None:
+        async with semaphore:
+            return await transcribe_audio_async(path, verbose)
+
+    return list(await asyncio.gather(*(bounded(path) for path in audio_file_paths)))
 
 
 def _transcribe_wav_file(
@@ -79,7 +200,7 @@ def _transcribe_wav_file(
 
     try:
 
-        model = LFM2AudioWrapper(config)
+        model = _get_model(config)
 
 
         transcription = model.transcribe_audio_file(audio_file_path)
@@ -93,3 +214,53 @@ def _transcribe_wav_file(
         if verbose:
             logger.error(f"❌ Transcription failed: {e}")
         return None
+
+
+def _get_model(config: Mapping[str, str | int | float]) -> LFM2AudioWrapper:
+    """Return the shared model wrapper for this configuration."""
+    with _model_lock:
+        return _load_model(tuple(sorted(config.items())))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_model(config_items: tuple[tuple[str, str | int | float], ...]) -> LFM2AudioWrapper:
+    """Build and validate a model wrapper once per distinct configuration."""
+    return LFM2AudioWrapper(dict(config_items))
+
+
+def _prepare_audio(
+    audio_file_path: str,
+    verbose: bool = False
+) -> tuple[str | None, bool]:
+    """
+    Get a WAV file the model can read, converting if needed.
+
+    Returns:
+        (wav_path, is_temp); wav_path is None if conversion failed
+
+    Raises:
+        FileNotFoundError: If the audio file does not exist
+    """
+    if not os.path.exists(audio_file_path):
+        raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
+
+    if not needs_conversion(audio_file_path):
+        return audio_file_path, False
+
+    if verbose:
+        print(f"🔄 Converting {Path(audio_file_path).suffix} to WAV format...")
+
+    try:
+        return convert_audio_for_transcription(audio_file_path, "wav"), True
+    except Exception as e:
+        if verbose:
+            logger.error(f"❌ Audio conversion failed: {e}")
+        return None, False
+
+
+def _discard(file_path: str) -> None:
+    """Remove a temporary converted file, ignoring errors."""
+    try:
+        Path(file_path).unlink()
+    except OSError:
+        pass
@@ -1,18 +1,81 @@
 """Model and binary downloader for Liqui-Speak."""
 
+import contextlib
+import hashlib
+import json
 import logging
+import os
 import shutil
-import zipfile
-from pathlib import Path
+import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path, PurePosixPath
 
-from huggingface_hub import hf_hub_download
+# Default cap on model files downloaded at the same time
+_DEFAULT_DOWNLOAD_WORKERS = 8
+
+# Buffer size for streaming files out of the runner archive
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+# HTTP client packages huggingface_hub may use (it moved from httpx to httpx2)
+_HTTP_CLIENT_MODULES = ("httpx", "httpx2")
+
+
+@contextlib.contextmanager
+def _xet_high_performance() -> Iterator[None]:
+    """
+    Let hf_xet fetch files over several connections while downloading.
+
+    The variable is only set for the duration of the block, so package
+    installs and other child processes started later do not inherit it.
+    hf_xet reads it once, on its first transfer in the process. A value the
+    user set explicitly is left alone.
+    """
+    if "HF_XET_HIGH_PERFORMANCE" in os.environ:
+        yield
+        return
+
+    os.environ["HF_XET_HIGH_PERFORMANCE"] = "1"
+    try:
+        yield
+    finally:
+        os.environ.pop("HF_XET_HIGH_PERFORMANCE", None)
+
+
+def _is_transient_error(error: Exception) -> bool:
+    """Check whether a failed download may succeed if simply tried again."""
+    from huggingface_hub.errors import HfHubHTTPError
+
+    if isinstance(error, HfHubHTTPError):
+        # Missing files and auth failures will not fix themselves
+        response = error.response
+        return response is None or response.status_code == 429 or response.status_code >= 500
+
+    # hf_xet reports transfer failures as RuntimeError
+    if isinstance(error, (RuntimeError, ConnectionError, TimeoutError)):
+        return True
+
+    return any(
+        isinstance(error, module.TransportError)
+        for module in map(sys.modules.get, _HTTP_CLIENT_MODULES)
+        if module is not None
+    )
 
 
 class ModelDownloader:
     """Handles downloading models and binaries from Hugging Face."""
 
-    def __init__(self):
+    def __init__(self, max_workers: int | None = None):
+        """
+        Initialize the downloader.
+
+        Args:
+            max_workers: Parallel model downloads (defaults to
+                HF_PARALLEL_DOWNLOADING_WORKERS, then 8)
+        """
         self.repo_id = "LiquidAI/LFM2.5-Audio-1.5B-GGUF"
+        self.max_workers = max_workers
+        self._remote_metadata: dict[str, tuple[int | None, str | None]] | None = None
         self.logger = logging.getLogger("liqui_speak")
 
     def download_all_models(self, target_dir: Path, quant: str = "F16") -> bool:
@@ -33,22 +96,117 @@ class ModelDownloader:
 
         self.logger.info(f"Downloading LFM2.5-Audio-1.5B ({quant}) model files...")
 
-        for filename in model_files:
-            self.logger.info(f"Downloading {filename}...")
-            try:
-                hf_hub_download(
-                    repo_id=self.repo_id,
-                    filename=filename,
-                    local_dir=str(target_dir),
-                    token=None
+        # Fetched once here rather than from every worker
+        try:
+            published = self._remote_file_metadata()
+        except Exception as e:
+            self.logger.warning(
+                f"Could not fetch published file metadata ({e}), skipping size and checksum checks"
+            )
+            published = {}
+
+        # Files are independent, so fetch them concurrently
+        workers = self._download_workers(len(model_files))
+
+        with _xet_high_performance(), ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {}
+            for filename in model_files:
+                self.logger.info(f"Downloading {filename}...")
+                expected_size, sha256 = published.get(filename, (None, None))
+                future = executor.submit(
+                    self._download_file, filename, target_dir, expected_size, sha256
                 )
+                futures[future] = filename
+
+            for future in as_completed(futures):
+                filename = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    self.logger.error(f"Failed to download {filename}: {e}")
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    return False
                 self.logger.info(f"{filename} downloaded")
-            except Exception as e:
-                self.logger.error(f"Failed to download {filename}: {e}")
-                return False
 
         return True
 
+    def _download_file(
+        self,
+        filename: str,
+        target_dir: Path,
+        expected_size: int | None = None,
+        sha256: str | None = None
+    ) -> str:
+        """
+        Download one model file unless a complete copy is already on disk.
+
+        Completeness is judged by the size published on the Hub. Fresh
+        downloads are checked against the published SHA-256 and fetched
+        again from scratch once if they do not match.
+
+        Args:
+            filename: File to download from the repo
+            target_dir: Directory to save it in
+            expected_size: Published size in bytes, if known
+            sha256: Published SHA-256 hex digest, if known
+        """
+        local_path = target_dir / filename
+        if expected_size is not None:
+            try:
+                if local_path.stat().st_size == expected_size:
+                    self.logger.info(f"{filename} already complete, skipping")
+                    return str(local_path)
+            except FileNotFoundError:
+                pass
+
+        path = self._fetch_file(filename, target_dir)
+        if sha256 is None or self.get_file_hash(Path(path)) == sha256:
+            return path
+
+        self.logger.warning(f"Checksum mismatch for {filename}, downloading again")
+        Path(path).unlink(missing_ok=True)
+        path = self._fetch_file(filename, target_dir, force_download=True)
+        if self.get_file_hash(Path(path)) != sha256:
+            Path(path).unlink(missing_ok=True)
+            raise ValueError(f"Checksum mismatch for {filename}")
+        return path
+
+    def _fetch_file(self, filename: str, target_dir: Path, force_download: bool = False) -> str:
+        """Fetch one model file, retrying once after a network or transfer error."""
+        from huggingface_hub import hf_hub_download
+
+        try:
+            return hf_hub_download(
+                repo_id=self.repo_id,
+                filename=filename,
+                local_dir=str(target_dir),
+                force_download=force_download,
+                token=None
+            )
+        except Exception as e:
+            if not _is_transient_error(e):
+                raise
+            self.logger.warning(f"Download of {filename} failed ({e}), retrying once")
+            return hf_hub_download(
+                repo_id=self.repo_id,
+                filename=filename,
+                local_dir=str(target_dir),
+                force_download=force_download,
+                token=None
+            )
+
+    def _download_workers(self, file_count: int) -> int:
+        """Number of parallel downloads, capped by the number of files."""
+        workers = self.max_workers
+        if workers is None:
+            try:
+                workers = int(os.environ.get(
+                    "HF_PARALLEL_DOWNLOADING_WORKERS", _DEFAULT_DOWNLOAD_WORKERS
+                ))
+            except ValueError:
+                workers = _DEFAULT_DOWNLOAD_WORKERS
+        return max(1, min(workers, file_count))
+
     def download_binary(self, target_dir: Path, platform: str) -> Path | None:
         """
         Download platform-specific llama.cpp binary.
@@ -60,78 +218,212 @@ class ModelDownloader:
         Returns:
             Path to extracted binary or None if failed
         """
+        import zipfile
+
+        from huggingface_hub import hf_hub_download
+
         binary_zip = f"llama-liquid-audio-{platform}.zip"
         runners_dir = target_dir / "runners" / platform
         runners_dir.mkdir(parents=True, exist_ok=True)
 
         self.logger.info(f"Downloading {platform} binary...")
+        zip_path = target_dir / "runners" / binary_zip
 
         try:
 
-            hf_hub_download(
-                repo_id=self.repo_id,
-                filename=f"runners/{binary_zip}",
-                local_dir=str(target_dir)
-            )
-            zip_path = target_dir / "runners" / binary_zip
+            with _xet_high_performance():
+                hf_hub_download(
+                    repo_id=self.repo_id,
+                    filename=f"runners/{binary_zip}",
+                    local_dir=str(target_dir)
+                )
 
 
             self.logger.info("Extracting binary...")
+            binary_name = "llama-liquid-audio-cli"
+            bin_dir = runners_dir / "bin"
+            final_path = bin_dir / binary_name
+
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(runners_dir)
+                entries = [info for info in zip_ref.infolist() if not info.is_dir()]
+                binary_entry = next(
+                    (info for info in entries
+                     if PurePosixPath(info.filename).name == binary_name),
+                    None
+                )
 
+                if binary_entry is None:
+                    self.logger.error(f"Binary not found in {binary_zip}")
+                    return None
+
+                # Stream the binary and the shared libraries next to it into a
+                # staging directory, skipping everything else in the archive
+                binary_dir = PurePosixPath(binary_entry.filename).parent
+                staging_dir = runners_dir / ".bin.staging"
+                shutil.rmtree(staging_dir, ignore_errors=True)
+                staging_dir.mkdir()
+
+                try:
+                    for info in entries:
+                        entry_path = PurePosixPath(info.filename)
+                        if entry_path.parent != binary_dir:
+                            continue
+                        with zip_ref.open(info) as src, \
+                                open(staging_dir / entry_path.name, "wb") as dst:
+                            shutil.copyfileobj(src, dst, _COPY_BUFFER_SIZE)
+
+                    (staging_dir / binary_name).chmod(0o755)
+                    self._swap_in_directory(staging_dir, bin_dir)
+                finally:
+                    shutil.rmtree(staging_dir, ignore_errors=True)
+
+            self.logger.info(f"Binary extracted to {final_path}")
+            return final_path
 
-            binary_name = "llama-liquid-audio-cli"
-            binary_path = None
+        except Exception as e:
+            self.logger.error(f"Failed to download binary: {e}")
+            return None
 
+        finally:
+            # The archive is only needed for extraction; drop it on failure too
+            zip_path.unlink(missing_ok=True)
 
-            for item in runners_dir.iterdir():
-                if item.is_dir():
-                    binary_candidate = item / binary_name
-                    if binary_candidate.exists():
-                        binary_path = binary_candidate
-                        break
+    def _swap_in_directory(self, staging_dir: Path, target_dir: Path) -> None:
+        """
+        Replace target_dir with a fully populated staging_dir.
 
+        Directories cannot be renamed over non-empty ones, so the old copy is
+        moved aside first; an interrupted extraction never leaves a
+        half-populated target behind.
+        """
+        retired_dir = target_dir.with_name(f".{target_dir.name}.old")
+        shutil.rmtree(retired_dir, ignore_errors=True)
 
-            if binary_path:
-                final_path = runners_dir / "bin" / binary_name
-                final_path.parent.mkdir(exist_ok=True)
+        if target_dir.exists():
+            os.rename(target_dir, retired_dir)
+        try:
+            os.rename(staging_dir, target_dir)
+        except OSError:
+            if retired_dir.exists():
+                os.rename(retired_dir, target_dir)
+            raise
 
+        shutil.rmtree(retired_dir, ignore_errors=True)
 
-                if binary_path.parent != runners_dir:
-                    for file in binary_path.parent.iterdir():
-                        if file.is_file():
-                            dest = final_path.parent / file.name
-                            shutil.copy2(file, dest)
+    def get_file_hash(self, filepath: Path) -> str:
+        """
+        Compute the SHA-256 hex digest of a file.
 
+        hashlib.file_digest reads straight into OpenSSL with a large buffer,
+        avoiding a Python-level read loop over multi-GB model files.
 
-                final_path.chmod(0o755)
+        Args:
+            filepath: File to hash
 
+        Returns:
+            Lowercase hex SHA-256 digest
+        """
+        with open(filepath, "rb", buffering=0) as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
 
-                zip_path.unlink()
+    def verify_downloads(self, target_dir: Path, quant: str = "F16") -> bool:
+        """
+        Verify all required files are downloaded and intact.
 
-                self.logger.info(f"Binary extracted to {final_path}")
-                return final_path
-            else:
-                self.logger.error(f"Binary not found in {binary_zip}")
-                return None
+        File sizes are compared against those published on the Hub. Files that
+        pass are recorded in the manifest with their mtime, so later checks
+        only re-probe files that changed on disk since.
 
-        except Exception as e:
-            self.logger.error(f"Failed to download binary: {e}")
-            return None
+        Args:
+            target_dir: Directory holding the model files
+            quant: Quantization level (F16, Q8_0, Q4_0)
 
-    def verify_downloads(self, target_dir: Path) -> bool:
-        """Verify all required files are downloaded and intact."""
+        Returns:
+            True if every file is present with the expected size
+        """
+        from liqui_speak.core.config import existing_files_in, get_model_files
 
-        for filename in self.model_files:
-            filepath = target_dir / filename
-            if not filepath.exists():
-                self.logger.error(f"Missing model file: {filename}")
+        model_files = list(get_model_files(quant).values())
+
+        present = existing_files_in(target_dir)
+        for filename in model_files:
+            if filename not in present:
+                self.logger.info(f"Missing model file: {filename}")
                 return False
 
+        manifest = self._load_manifest()
+        stats = {filename: (target_dir / filename).stat() for filename in model_files}
+        changed = [
+            filename for filename, st in stats.items()
+            if manifest.get(filename, {}).get("size") != st.st_size
+            or manifest.get(filename, {}).get("mtime_ns") != st.st_mtime_ns
+        ]
+        if not changed:
+            return True
 
+        try:
+            remote = self._remote_file_metadata()
+        except Exception as e:
+            # Offline: presence is all that can be checked
+            self.logger.warning(f"Could not fetch published file sizes ({e}), skipping size check")
+            return True
+
+        intact = True
+        for filename in changed:
+            st = stats[filename]
+            expected_size, sha256 = remote.get(filename, (None, None))
+            if expected_size is not None and st.st_size != expected_size:
+                self.logger.error(
+                    f"Incomplete model file: {filename} "
+                    f"({st.st_size} of {expected_size} bytes)"
+                )
+                manifest.pop(filename, None)
+                intact = False
+                continue
+            manifest[filename] = {
+                "size": st.st_size,
+                "sha256": sha256,
+                "mtime_ns": st.st_mtime_ns,
+            }
+
+        self._save_manifest(manifest)
+        return intact
+
+    def _remote_file_metadata(self) -> dict[str, tuple[int | None, str | None]]:
+        """Fetch published (size, sha256) for every file in the repo, once."""
+        if self._remote_metadata is None:
+            from huggingface_hub import HfApi
+
+            info = HfApi().model_info(self.repo_id, files_metadata=True)
+            self._remote_metadata = {
+                sibling.rfilename: (
+                    sibling.size,
+                    sibling.lfs.sha256 if sibling.lfs is not None else None,
+                )
+                for sibling in info.siblings or []
+            }
+        return self._remote_metadata
 
+    def _load_manifest(self) -> dict[str, dict]:
+        """Load the verified file manifest, or an empty one if unreadable."""
+        from liqui_speak.core.config import get_manifest_path
 
-        return True
+        try:
+            with open(get_manifest_path()) as f:
+                manifest = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+
+    def _save_manifest(self, manifest: dict[str, dict]) -> None:
+        """Write the verified file manifest atomically."""
+        from liqui_speak.core.config import get_manifest_path
+
+        manifest_path = get_manifest_path()
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        partial = manifest_path.with_name(f"{manifest_path.name}.part")
+        with open(partial, "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(partial, manifest_path)
 
 
@@ -1,18 +1,63 @@
 """Model wrapper for llama.cpp LFM2.5-Audio integration."""
 
+import functools
 import logging
+import os
+import re
 import subprocess
+import threading
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping
 from pathlib import Path
 
-from liqui_speak.core.config import get_config
+from liqui_speak.core.config import existing_files_in, get_config
 from liqui_speak.models.base import BaseModelBackend
 from liqui_speak.platform.detector import PlatformDetector
 
+# Runner executable shipped in each platform bundle
+_BINARY_NAME = "llama-liquid-audio-cli"
+
+# Marks the start of the transcription in runner output
+_MARKER = b"=== GENERATED TEXT ==="
+
+# Trailing runner output lines quoted in a failure message
+_ERROR_CONTEXT_LINES = 20
+
+# Runner log lines to drop when the output has no generated-text marker;
+# matched on raw bytes so dropped lines are never decoded
+_SKIP_RE = re.compile(b"|".join(re.escape(pattern.encode()) for pattern in [
+    "load_gguf:", "main:", "encoding audio", "audio slice",
+    "decoding audio", "n_tokens_batch", "audio decoded",
+    "audio samples per second", "text tokens per second",
+    "samples per second", "tokens per second", " ms"
+]))
+
+
+@functools.lru_cache(maxsize=1)
+def _resolved_binary_path(binary_root: str) -> Path:
+    """
+    Locate the runner binary for this platform.
+
+    Cached once found; failures raise and are re-checked on the next call.
+    """
+    detector = PlatformDetector()
+    platform = detector.get_supported_platform()
+
+    if not platform:
+        raise RuntimeError(f"Unsupported platform: {detector.system}-{detector.machine}")
+
+    binary_path = Path(binary_root) / platform / "bin" / _BINARY_NAME
+
+    if not binary_path.exists():
+        raise ValueError(f"Binary not found: {binary_path}")
+
+    return binary_path
+
 
 class LFM2AudioWrapper(BaseModelBackend):
     """Wrapper for llama-lfm2-audio binary."""
 
-    def __init__(self, config: dict[str, str | int | float] | None = None):
+    def __init__(self, config: Mapping[str, str | int | float] | None = None):
         """
         Initialize the model wrapper.
 
@@ -21,6 +66,7 @@ class LFM2AudioWrapper(BaseModelBackend):
         """
         self.config = config or get_config()
         self._validate_config()
+        self._binary_path = _resolved_binary_path(str(self.config["binary_path"]))
         self.logger = logging.getLogger("liqui_speak")
 
     def _validate_config(self) -> None:
@@ -32,8 +78,14 @@ class LFM2AudioWrapper(BaseModelBackend):
             str(self.config["tokenizer_path"]),
         ]
 
+        # The files normally share one directory, so list it once instead
+        # of stat-ing each path
+        listings: dict[str, frozenset[str]] = {}
         for file_path in required_files:
-            if not Path(file_path).exists():
+            parent, name = os.path.split(file_path)
+            if parent not in listings:
+                listings[parent] = existing_files_in(parent or ".")
+            if name not in listings[parent]:
                 raise ValueError(f"Missing required file: {file_path}")
 
     def transcribe_audio_file(self, audio_file_path: str) -> str | None:
@@ -49,57 +101,62 @@ class LFM2AudioWrapper(BaseModelBackend):
         Raises:
             RuntimeError: If transcription fails
         """
-        audio_path = Path(audio_file_path)
-
-        if not audio_path.exists():
+        if not os.path.exists(audio_file_path):
             raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
 
 
-        detector = PlatformDetector()
-        platform = detector.get_supported_platform()
-
-        if not platform:
-            raise RuntimeError(f"Unsupported platform: {detector.system}-{detector.machine}")
-
-        binary_path = Path(str(self.config["binary_path"])) / platform / "bin" / "llama-liquid-audio-cli"
-
-        if not binary_path.exists():
-            raise ValueError(f"Binary not found: {binary_path}")
-
-
         cmd = [
-            str(binary_path),
+            str(self._binary_path),
             "-m", str(self.config["model_path"]),
             "--mmproj", str(self.config["mmproj_path"]),
             "-mv", str(self.config["vocoder_path"]),
             "--tts-speaker-file", str(self.config["tokenizer_path"]),
             "-sys", "Perform ASR.",
-            "--audio", str(audio_path)
+            "--audio", str(audio_file_path)
         ]
 
-        try:
+        timeout = float(self.config.get("transcription_timeout", 60))
+        timed_out = threading.Event()
+        recent: deque[bytes] = deque(maxlen=_ERROR_CONTEXT_LINES)
 
-            timeout = float(self.config.get("transcription_timeout", 60))
+        def tee(lines: Iterable[bytes]) -> Iterator[bytes]:
+            for line in lines:
+                recent.append(line)
+                yield line
 
-
-            result = subprocess.run(
+        try:
+            with subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.DEVNULL,
-                text=True,
-                timeout=timeout,
-                check=False,
                 shell=False
-            )
-
-            if result.returncode != 0:
-                error_msg = f"Transcription failed with code {result.returncode}"
-                if result.stdout:
-                    error_msg += f": {result.stdout}"
+            ) as proc:
+
+                def kill() -> None:
+                    timed_out.set()
+                    proc.kill()
+
+                assert proc.stdout is not None  # stdout=PIPE above
+
+                timer = threading.Timer(timeout, kill)
+                timer.start()
+                try:
+                    # Filter lines as the runner prints them rather than
+                    # holding its whole log until it exits
+                    transcription = self._parse_output(tee(proc.stdout))
+                    returncode = proc.wait()
+                finally:
+                    timer.cancel()
+
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(cmd, timeout)
+
+            if returncode != 0:
+                error_msg = f"Transcription failed with code {returncode}"
+                if recent:
+                    error_msg += f": {b''.join(recent).decode('utf-8', errors='replace')}"
                 raise RuntimeError(error_msg)
 
-
-            transcription = self._parse_output(result.stdout)
             return transcription
 
         except subprocess.TimeoutExpired:
@@ -107,40 +164,41 @@ class LFM2AudioWrapper(BaseModelBackend):
         except Exception as e:
             raise RuntimeError(f"Transcription failed: {str(e)}") from e
 
-    def _parse_output(self, output: str | None) -> str | None:
-        """Parse model output to extract transcription from LFM2.5 output."""
-        if output is None:
+    def _parse_output(self, lines: Iterable[bytes] | None) -> str | None:
+        """Parse model output lines to extract transcription from LFM2.5 output."""
+        if lines is None:
             return None
 
         # LFM2.5 output format includes metadata followed by:
         # === GENERATED TEXT === <actual transcription>
-        # Extract only the text after the marker
-        marker = "=== GENERATED TEXT ==="
-        if marker in output:
-            # Get everything after the marker
-            text = output.split(marker, 1)[1].strip()
-            return text if text else None
-
-        # Fallback: filter out known metadata patterns
-        lines = output.strip().split('\n')
+        # Keep everything after the marker; until it shows up, collect the
+        # lines that are not known metadata in case it never does
+        generated: list[bytes] | None = None
         transcription_lines = []
         for line in lines:
-            line = line.strip()
-            if not line:
+            if generated is not None:
+                generated.append(line)
+                continue
+
+            if _MARKER in line:
+                generated = [line.partition(_MARKER)[2]]
                 continue
 
-            # Skip metadata lines
-            if any(pattern in line for pattern in [
-                "load_gguf:", "main:", "encoding audio", "audio slice",
-                "decoding audio", "n_tokens_batch", "audio decoded",
-                "audio samples per second", "text tokens per second",
-                "samples per second", "tokens per second", " ms"
-            ]):
+            # Skip blank and metadata lines
+            line = line.strip()
+            if not line or _SKIP_RE.search(line):
                 continue
 
             transcription_lines.append(line)
 
-        transcription = ' '.join(transcription_lines).strip()
+        if generated is not None:
+            transcription = b''.join(generated).strip()
+        else:
+            # Lines are already stripped and non-empty
+            transcription = b' '.join(transcription_lines)
+
+        # Only the kept text is decoded, once
+        transcription = transcription.decode('utf-8', errors='replace')
         return transcription if transcription else None
 
     def test_model(self, test_audio_path: str | None = None) -> bool:
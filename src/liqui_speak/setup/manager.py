@@ -3,22 +3,36 @@
 import importlib
 import importlib.util
 import logging
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from liqui_speak.core.config import SETUP_DIR
 from liqui_speak.models.downloader import ModelDownloader
 from liqui_speak.platform.detector import PlatformDetector
 from liqui_speak.setup.shortcut_template import install_shortcut
 
+# Linux package managers in order of preference:
+# (index refresh command or None, install command, packages)
+_LINUX_PACKAGE_MANAGERS: dict[str, tuple[list[str] | None, list[str], list[str]]] = {
+    "apt-get": (["apt-get", "update"], ["apt-get", "install", "-y"], ["portaudio19-dev", "ffmpeg"]),
+    "dnf": (None, ["dnf", "install", "-y"], ["portaudio-devel", "ffmpeg"]),
+    "yum": (None, ["yum", "install", "-y"], ["portaudio-devel", "ffmpeg"]),
+    "pacman": (None, ["pacman", "-S", "--noconfirm"], ["portaudio", "ffmpeg"]),
+    "zypper": (None, ["zypper", "--non-interactive", "install"], ["portaudio-devel", "ffmpeg"]),
+    "apk": (None, ["apk", "add"], ["portaudio-dev", "ffmpeg"]),
+}
+
 
 class SetupManager:
     """Handles automatic installation of system dependencies and models."""
 
-    def __init__(self):
+    def __init__(self, download_workers: int | None = None):
         self.platform = PlatformDetector()
-        self.model_downloader = ModelDownloader()
-        self.setup_dir = Path.home() / ".liqui_speak"
+        self.model_downloader = ModelDownloader(max_workers=download_workers)
+        self.setup_dir = SETUP_DIR
         self.setup_dir.mkdir(exist_ok=True)
         self.logger = logging.getLogger("liqui_speak")
 
@@ -40,19 +54,29 @@ class SetupManager:
         try:
 
             if verbose:
-                self.logger.info("Installing system dependencies...")
-            self._install_system_dependencies(force=force)
+                self.logger.info("Setting up Python environment...")
+            self._setup_python_environment(force=force)
 
 
+            # Prompts happen here, before anything else writes to the terminal
             if verbose:
-                self.logger.info("Setting up Python environment...")
-            self._setup_python_environment(force=force)
+                self.logger.info("Checking system dependencies...")
+            install_commands = self._plan_system_dependencies(force=force)
 
 
+            # Package installs and model downloads are independent, so
+            # overlap them. The short install runs here so a failure is
+            # reported at once instead of after the download finishes
             if verbose:
-                self.logger.info("Downloading models...")
-            self._download_models(force=force, quant=quant)
-            
+                self.logger.info("Installing system dependencies and downloading models...")
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="liqui_speak_setup")
+            download = executor.submit(self._download_models, force=force, quant=quant)
+            try:
+                self._install_system_dependencies(install_commands)
+                download.result()
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+
             # Save user configuration
             from liqui_speak.core.config import save_user_config
             save_user_config({"quant": quant})
@@ -82,31 +106,49 @@ class SetupManager:
                 self.logger.info("Try running with --verbose for more details")
             return False
 
-    def _install_system_dependencies(self, force: bool = False) -> None:
-        """Install PortAudio and FFmpeg system dependencies."""
+    def _plan_system_dependencies(self, force: bool = False) -> list[tuple[list[str], bool]]:
+        """
+        Work out the PortAudio and FFmpeg install commands for this platform.
+
+        Every interactive step (confirmation, sudo password) happens here, so
+        the returned commands can run unattended alongside the model download.
+
+        Args:
+            force: Force reinstallation even if dependencies already exist
+
+        Returns:
+            (command, check) pairs; a failing command with check False is tolerated
+        """
         system = self.platform.system
 
         if system == "Darwin":
-            self._install_macos_dependencies(force=force)
+            return self._macos_install_commands(force=force)
         elif system == "Linux":
-            self._install_linux_dependencies(force=force)
+            return self._linux_install_commands(force=force)
         elif system == "Windows":
-            self._install_windows_dependencies(force=force)
+            return self._windows_install_commands(force=force)
         else:
             raise RuntimeError(f"Unsupported platform: {system}")
 
-    def _install_macos_dependencies(self, force: bool = False) -> None:
-        """Install dependencies on macOS."""
+    def _install_system_dependencies(self, commands: list[tuple[list[str], bool]]) -> None:
+        """Run install commands from _plan_system_dependencies without prompting."""
+        for command, check in commands:
+            self.logger.info(f"Running {' '.join(command)}...")
+            subprocess.run(command, stdin=subprocess.DEVNULL, check=check)
+
+    def _macos_install_commands(self, force: bool = False) -> list[tuple[list[str], bool]]:
+        """Get the Homebrew commands for missing dependencies on macOS."""
         if not self._command_exists("brew"):
             raise RuntimeError("Homebrew not found. Please install from https://brew.sh")
 
+        commands = []
         packages = ["portaudio", "ffmpeg"]
         for package in packages:
             if force or not self._command_exists(package):
-                self.logger.info(f"Installing {package}...")
-                subprocess.run(["brew", "install", package], check=True)
+                commands.append((["brew", "install", package], True))
             else:
                 self.logger.info(f"{package} already installed, skipping...")
+        return commands
 
     def _confirm_sudo_action(self, action_description: str) -> bool:
         """Ask user for confirmation before running sudo commands."""
@@ -114,35 +156,36 @@ class SetupManager:
         response = input("Continue? [y/N]: ").strip().lower()
         return response in ('y', 'yes')
 
-    def _install_linux_dependencies(self, force: bool = False) -> None:
-        """Install dependencies on Linux."""
+    def _linux_install_commands(self, force: bool = False) -> list[tuple[list[str], bool]]:
+        """Get the package manager commands for dependencies on Linux."""
+        # One PATH scan per manager; the first one present, in preference order, wins
+        available = {name: shutil.which(name) for name in _LINUX_PACKAGE_MANAGERS}
+        manager = next((name for name, path in available.items() if path), None)
+        if manager is None:
+            raise RuntimeError(
+                f"No supported package manager found ({'/'.join(_LINUX_PACKAGE_MANAGERS)})"
+            )
+
         if not self._confirm_sudo_action("install portaudio and ffmpeg"):
             raise RuntimeError("User cancelled installation")
 
+        # Ask for the password now and keep the install itself from prompting
+        subprocess.run(["sudo", "-v"], check=True)
 
-        if self._command_exists("apt-get"):
-            packages = ["portaudio19-dev", "ffmpeg"]
-            subprocess.run(["sudo", "apt-get", "update"], check=False)
-            subprocess.run(["sudo", "apt-get", "install", "-y"] + packages, check=True)
-
-        elif self._command_exists("yum"):
-            packages = ["portaudio-devel", "ffmpeg"]
-            subprocess.run(["sudo", "yum", "install", "-y"] + packages, check=True)
-
-        elif self._command_exists("pacman"):
-            packages = ["portaudio", "ffmpeg"]
-            subprocess.run(["sudo", "pacman", "-S", "--noconfirm"] + packages, check=True)
-        else:
-            raise RuntimeError("No supported package manager found (apt/yum/pacman)")
+        refresh, install, packages = _LINUX_PACKAGE_MANAGERS[manager]
+        commands = []
+        if refresh:
+            commands.append((["sudo", "-n"] + refresh, False))
+        commands.append((["sudo", "-n"] + install + packages, True))
+        return commands
 
-    def _install_windows_dependencies(self, force: bool = False) -> None:
-        """Install dependencies on Windows."""
+    def _windows_install_commands(self, force: bool = False) -> list[tuple[list[str], bool]]:
+        """Get the Chocolatey or Scoop commands for dependencies on Windows."""
         if self._command_exists("choco"):
             packages = ["portaudio", "ffmpeg"]
-            for package in packages:
-                subprocess.run(["choco", "install", package, "-y"], check=True)
+            return [(["choco", "install", package, "-y"], True) for package in packages]
         elif self._command_exists("scoop"):
-            subprocess.run(["scoop", "install", "portaudio", "ffmpeg"], check=True)
+            return [(["scoop", "install", "portaudio", "ffmpeg"], True)]
         else:
             raise RuntimeError(
                 "Chocolatey or Scoop not found. "
@@ -150,7 +193,7 @@ class SetupManager:
             )
 
     def _setup_python_environment(self, force: bool = False) -> None:
-        """Verify Python version and install PyDub/python-magic if needed."""
+        """Verify Python version and install PyDub/puremagic if needed."""
 
         self.logger.info(f"Python {sys.version.split()[0]} detected")
 
@@ -162,64 +205,35 @@ class SetupManager:
             subprocess.run([sys.executable, "-m", "pip", "install", "pydub"], check=True)
 
 
-        self._install_python_magic()
+        self._install_puremagic()
 
-    def _install_python_magic(self) -> None:
-        """Install python-magic with platform-specific handling."""
+    def _install_puremagic(self) -> None:
+        """Install puremagic for header-based audio format detection."""
 
-        if importlib.util.find_spec("magic") is not None:
-            self.logger.info("python-magic already installed")
+        if importlib.util.find_spec("puremagic") is not None:
+            self.logger.info("puremagic already installed")
             return
 
-        system = self.platform.system
-
-        if system == "Windows":
-
-            self.logger.info("Installing python-magic-bin for Windows...")
-            subprocess.run([sys.executable, "-m", "pip", "install", "python-magic-bin"], check=True)
-        else:
-
-            self.logger.info("Installing python-magic...")
-            subprocess.run([sys.executable, "-m", "pip", "install", "python-magic"], check=True)
-
-
-        try:
-            importlib.util.find_spec("magic")
-            self.logger.info("python-magic installation verified")
-        except ImportError as e:
-            if system == "Windows":
-                raise RuntimeError(
-                    "python-magic installation failed. Try manually installing "
-                    "python-magic-bin: pip install python-magic-bin"
-                ) from e
-            else:
-                raise RuntimeError(
-                    f"python-magic installation failed. Ensure libmagic is installed: {e}"
-                ) from e
+        self.logger.info("Installing puremagic...")
+        subprocess.run([sys.executable, "-m", "pip", "install", "puremagic"], check=True)
 
     def _download_models(self, force: bool = False, quant: str = "F16") -> None:
         """Download LFM2.5-Audio model and binaries."""
-        from liqui_speak.core.config import get_model_files
-        
         model_dir = self.setup_dir / "models"
         model_dir.mkdir(exist_ok=True)
 
-        model_files_dict = get_model_files(quant)
-        model_files = list(model_files_dict.values())
-
-        all_models_exist = all((model_dir / filename).exists() for filename in model_files)
-
-        if all_models_exist and not force:
+        if not force and self.model_downloader.verify_downloads(model_dir, quant=quant):
             self.logger.info("Model files already downloaded")
         else:
             self.logger.info(f"Downloading LFM2.5-Audio-1.5B ({quant}) model files...")
 
             self.model_downloader.download_all_models(model_dir, quant=quant)
 
+            if not self.model_downloader.verify_downloads(model_dir, quant=quant):
+                raise RuntimeError("Model files are missing or incomplete after download")
+
 
-        from liqui_speak.platform.detector import PlatformDetector
-        detector = PlatformDetector()
-        platform = detector.get_supported_platform()
+        platform = self.platform.get_supported_platform()
 
         if platform:
             binary_path = model_dir / "runners" / platform / "bin" / "llama-liquid-audio-cli"
@@ -231,7 +245,7 @@ class SetupManager:
                 if binary_result:
                     self.logger.info(f"Binary downloaded: {binary_result}")
         else:
-            self.logger.warning(f"Platform {detector.system}-{detector.machine} not supported for binaries")
+            self.logger.warning(f"Platform {self.platform.system}-{self.platform.machine} not supported for binaries")
 
     def _verify_installation(self, force: bool = False) -> None:
         """Verify that everything is working correctly."""
@@ -239,7 +253,7 @@ class SetupManager:
         deps = {
             "ffmpeg": self._command_exists("ffmpeg"),
             "pydub": self._check_python_module("pydub"),
-            "python-magic": self._check_python_module("magic"),
+            "puremagic": self._check_python_module("puremagic"),
         }
 
         missing = [name for name, installed in deps.items() if not installed]
@@ -250,27 +264,14 @@ class SetupManager:
 
     def _command_exists(self, command: str) -> bool:
         """Check if a system command exists."""
-        try:
-
-            if command == "ffmpeg":
-                subprocess.run([command, "-version"],
-                             capture_output=True, check=True)
-            elif command == "portaudio":
-                return self.platform._check_portaudio()
-            else:
-                subprocess.run([command, "--version"],
-                             capture_output=True, check=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        if command == "portaudio":
+            # A library rather than a command, so it is not found on PATH
+            return self.platform._check_portaudio()
+        return shutil.which(command) is not None
 
     def _check_python_module(self, module: str) -> bool:
-        """Check if a Python module is installed."""
-        try:
-            __import__(module)
-            return True
-        except ImportError:
-            return False
+        """Check if a Python module is installed without importing it."""
+        return importlib.util.find_spec(module) is not None
 
     def _install_shortcut(self, verbose: bool = True) -> None:
         """Install macOS Shortcut for voice transcription."""
@@ -279,7 +280,6 @@ class SetupManager:
         
         # Find the liqui-speak binary path
         # Try to find it in the current venv or system path
-        import shutil
         binary_path = shutil.which("liqui-speak")
         
         if not binary_path: